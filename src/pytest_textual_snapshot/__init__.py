@@ -1,6 +1,7 @@
 from __future__ import annotations
 import re
 import asyncio
+import functools
 import os
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -16,7 +17,7 @@ from typing import (
     Iterable,
     TYPE_CHECKING,
     Dict,
-    Tuple,
+    Mapping,
 )
 
 import pytest
@@ -30,6 +31,8 @@ from syrupy import SnapshotAssertion
 from syrupy.extensions.image import SVGImageSnapshotExtension
 import hashlib
 
+from textual._doc import take_svg_screenshot
+from textual._import_app import import_app
 from textual.app import App
 
 if TYPE_CHECKING:
@@ -39,7 +42,23 @@ TEXTUAL_SNAPSHOT_SVG_KEY = pytest.StashKey[str]()
 TEXTUAL_ACTUAL_SVG_KEY = pytest.StashKey[str]()
 TEXTUAL_SNAPSHOT_PASS = pytest.StashKey[bool]()
 
-SNAPSHOT_RESULTS = pytest.StashKey[Dict[str, Tuple[bool, App, str, str]]]()
+
+@dataclass
+class SnapshotResult:
+    """The outcome of a single named `app_snapshot` comparison."""
+
+    __slots__ = ("passed", "app", "actual", "snapshot")
+
+    passed: bool
+    app: App
+    actual: str
+    snapshot: str
+
+
+SNAPSHOT_RESULTS = pytest.StashKey[Dict[str, SnapshotResult]]()
+
+_TERMINAL_NUM_RE = re.compile(r"terminal-\d+")
+_TERMINAL_HEX_RE = re.compile(r"terminal-[0-9a-f]+-[0-9a-f]+")
 
 
 def pytest_addoption(parser):
@@ -60,10 +79,26 @@ def app_stash_key() -> pytest.StashKey:
         app_stash_key._key = pytest.StashKey[App]()
     return app_stash_key()
 
+@functools.lru_cache(maxsize=4096)
 def _hash(s: str) -> str:
+    # The digest ends up in the classnames of snapshots saved to disk, so changing
+    # the algorithm here would invalidate every existing `app_snapshot` snapshot.
     return hashlib.md5(s.encode('utf-8')).hexdigest()
 
 
+@functools.lru_cache(maxsize=512)
+def _resolve_app_path(node_path: str, app_path: str) -> str:
+    return str((Path(node_path) / app_path).resolve())
+
+
+@functools.lru_cache(maxsize=None)
+def _snapshot_report_template() -> Template:
+    """Read and compile the snapshot report template, once per process."""
+    this_file_path = Path(__file__)
+    snapshot_template_path = this_file_path.parent / "snapshot_report_template.jinja2"
+    return Template(snapshot_template_path.read_text())
+
+
 @pytest.fixture
 def snap_compare(
     snapshot: SnapshotAssertion, request: FixtureRequest
@@ -98,8 +133,6 @@ def snap_compare(
         Returns:
             Whether the screenshot matches the snapshot.
         """
-        from textual._import_app import import_app
-
         node = request.node
         path = Path(app_path)
         if path.is_absolute():
@@ -109,10 +142,7 @@ def snap_compare(
             # If a relative path is supplied by the user, it's relative to the location of the pytest node,
             # NOT the location that `pytest` was invoked from.
             node_path = node.path.parent
-            resolved = (node_path / app_path).resolve()
-            app = import_app(str(resolved))
-
-        from textual._doc import take_svg_screenshot
+            app = import_app(_resolve_app_path(str(node_path), str(app_path)))
 
         actual_screenshot = take_svg_screenshot(
             app=app,
@@ -123,9 +153,17 @@ def snap_compare(
         result = snapshot == actual_screenshot
 
         if result is False:
-            # The split and join below is a mad hack, sorry...
-            node.stash[TEXTUAL_SNAPSHOT_SVG_KEY] = "\n".join(
-                str(snapshot).splitlines()[1:-1]
+            # The slicing below is a mad hack, sorry... it drops the first and
+            # last lines of the snapshot repr without splitting it into a list.
+            snapshot_repr = str(snapshot)
+            if snapshot_repr.endswith("\n"):
+                snapshot_repr = snapshot_repr[:-1]
+            first_newline = snapshot_repr.find("\n")
+            last_newline = snapshot_repr.rfind("\n")
+            node.stash[TEXTUAL_SNAPSHOT_SVG_KEY] = (
+                snapshot_repr[first_newline + 1 : last_newline]
+                if first_newline != last_newline
+                else ""
             )
             node.stash[TEXTUAL_ACTUAL_SVG_KEY] = actual_screenshot
             node.stash[app_stash_key()] = app
@@ -149,27 +187,35 @@ def app_snapshot(
         key = name if name is not None else "snapshot"
         node = request.node
         # take a snapshot; retry twice, with sleeps to prevent false positives
-        result = False
-        sleeps = [0.5, 0.1, 0]
-        while not result and sleeps:
-            await asyncio.sleep(sleeps.pop())
+        classname_placeholder = f"terminal-{_hash(node.nodeid)}-{_hash(key)}"
+        previous_screenshot = None
+        for delay in (0, 0.1, 0.5):
+            if delay:
+                await asyncio.sleep(delay)
             actual_screenshot = app.export_screenshot()
-            classname_pattern = r"terminal-\d+"
-            classname_placeholder = f"terminal-{_hash(node.nodeid)}-{_hash(key)}"
-            normalized_screenshot = re.sub(
-                classname_pattern, classname_placeholder, actual_screenshot
+            if actual_screenshot == previous_screenshot:
+                # Nothing has been rendered since the last failed attempt, so
+                # comparing against the snapshot again would fail the same way.
+                continue
+            previous_screenshot = actual_screenshot
+            normalized_screenshot = _TERMINAL_NUM_RE.sub(
+                classname_placeholder, actual_screenshot
             )
+            # syrupy resets the custom name after every assertion, so `snapshot(name=...)`
+            # has to be applied again on each attempt.
             result = normalized_screenshot == snapshot(name=name)
+            if result:
+                break
 
         results = node.stash.get(SNAPSHOT_RESULTS, {})
         if result is False:
             n = snapshot.num_executions
             historical_screenshot = str(snapshot.executions[n - 1].recalled_data)
-            results.update(
-                {key: (False, app, normalized_screenshot, historical_screenshot)}
+            results[key] = SnapshotResult(
+                False, app, normalized_screenshot, historical_screenshot
             )
         else:
-            results.update({key: (True, app, "", "")})
+            results[key] = SnapshotResult(True, app, "", "")
         node.stash[SNAPSHOT_RESULTS] = results
         return result
 
@@ -188,7 +234,7 @@ class SvgSnapshotDiff:
     path: PathLike
     line_number: int
     app: App
-    environment: dict
+    environment: Mapping[str, str]
 
 
 def pytest_sessionfinish(
@@ -205,31 +251,30 @@ def pytest_sessionfinish(
         path, line_index, name = item.reportinfo()
         # Grab the data our fixture attached to the pytest node
         if SNAPSHOT_RESULTS in item.stash:
-            for snap_name, result in item.stash[SNAPSHOT_RESULTS].items():
-                num_snapshots_passing += int(result[0])
-                app = result[1]
-                actual_svg = result[2]
-                classname_pattern = r"terminal-[0-9a-f]+-[0-9a-f]+"
-                adjusted_actual_svg = re.sub(
-                    classname_pattern, lambda m: f"{m.group()}-new", actual_svg
-                )
-                snapshot_svg = result[3]
-                if not result[0]:
+            snapshot_results = item.stash[SNAPSHOT_RESULTS]
+            num_snapshots_passing += sum(
+                result.passed for result in snapshot_results.values()
+            )
+            for snap_name, result in snapshot_results.items():
+                if not result.passed:
+                    adjusted_actual_svg = _TERMINAL_HEX_RE.sub(
+                        r"\g<0>-new", result.actual
+                    )
                     diffs.append(
                         SvgSnapshotDiff(
-                            snapshot=snapshot_svg,
+                            snapshot=result.snapshot,
                             actual=adjusted_actual_svg,
                             test_name=f"{name} : {snap_name}"
                             if snap_name != "snapshot"
                             else "",
                             path=path,
                             line_number=line_index + 1,
-                            app=app,
-                            environment=dict(os.environ),
+                            app=result.app,
+                            environment=os.environ,
                         )
                     )
         else:
-            num_snapshots_passing += int(item.stash.get(TEXTUAL_SNAPSHOT_PASS, False))
+            num_snapshots_passing += item.stash.get(TEXTUAL_SNAPSHOT_PASS, False)
             snapshot_svg = item.stash.get(TEXTUAL_SNAPSHOT_SVG_KEY, None)
             actual_svg = item.stash.get(TEXTUAL_ACTUAL_SVG_KEY, None)
             app = item.stash.get(app_stash_key(), None)
@@ -243,39 +288,33 @@ def pytest_sessionfinish(
                         path=path,
                         line_number=line_index + 1,
                         app=app,
-                        environment=dict(os.environ),
+                        environment=os.environ,
                     )
                 )
 
     if diffs:
         diff_sort_key = attrgetter("test_name")
-        diffs = sorted(diffs, key=diff_sort_key)
-
-        this_file_path = Path(__file__)
-        snapshot_template_path = (
-            this_file_path.parent / "snapshot_report_template.jinja2"
-        )
+        diffs.sort(key=diff_sort_key)
 
         snapshot_report_path = session.config.getoption("--snapshot-report")
-        snapshot_report_path = Path(snapshot_report_path)
         snapshot_report_path = Path.cwd() / snapshot_report_path
         snapshot_report_path.parent.mkdir(parents=True, exist_ok=True)
-        template = Template(snapshot_template_path.read_text())
+        template = _snapshot_report_template()
 
         num_fails = len(diffs)
         num_snapshot_tests = len(diffs) + num_snapshots_passing
 
-        rendered_report = template.render(
-            diffs=diffs,
-            passes=num_snapshots_passing,
-            fails=num_fails,
-            pass_percentage=100 * (num_snapshots_passing / max(num_snapshot_tests, 1)),
-            fail_percentage=100 * (num_fails / max(num_snapshot_tests, 1)),
-            num_snapshot_tests=num_snapshot_tests,
-            now=datetime.now(timezone.utc),
-        )
         with open(snapshot_report_path, "w+", encoding="utf-8") as snapshot_file:
-            snapshot_file.write(rendered_report)
+            template.stream(
+                diffs=diffs,
+                passes=num_snapshots_passing,
+                fails=num_fails,
+                pass_percentage=100
+                * (num_snapshots_passing / max(num_snapshot_tests, 1)),
+                fail_percentage=100 * (num_fails / max(num_snapshot_tests, 1)),
+                num_snapshot_tests=num_snapshot_tests,
+                now=datetime.now(timezone.utc),
+            ).dump(snapshot_file)
 
         session.config._textual_snapshots = diffs
         session.config._textual_snapshot_html_report = snapshot_report_path